@@ -28,25 +28,41 @@
 
 import inspect
 
+from functools import partial
+
 from typing import (
     Any,
     Callable,
     Dict,
     List,
     Optional,
-    Tuple
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+    get_type_hints
 )
 
+def _name(interface: Union[str, type]) -> str:
+    return interface if isinstance(interface, str) else interface.__name__
+
 class InjectorError(Exception):
     pass
 
 class CyclicDependencyError(InjectorError):
-    def __init__(self, interface: str, stack: List[str]) -> None:
-        super(CyclicDependencyError, self).__init__(
-            "Cyclic dependency detected while resolving {} (resolved: {})".format(
-                interface,
-                stack
-            )
+    def __init__(
+        self,
+        interface: Union[str, type],
+        stack: Sequence[Union[str, type]]
+    ) -> None:
+        super(CyclicDependencyError, self).__init__(interface, stack)
+        self.interface = interface
+        self.stack = stack
+
+    def __str__(self) -> str:
+        return "Cyclic dependency detected while resolving {} (resolved: {})".format(
+            _name(self.interface),
+            [_name(x) for x in self.stack]
         )
 
 class ImplementedError(InjectorError):
@@ -70,43 +86,144 @@ class UnimplementedError(InjectorError):
             "Interface {} is not implemented".format(interface)
         )
 
+def _identity(value: Any) -> Any:
+    return value
+
+# A compiled construction step: the result slot, the implementation, the
+# parameter names (None when the dependencies can be passed positionally)
+# and the slots holding the dependencies.
+_Step = Tuple[int, type, Optional[Tuple[str, ...]], Tuple[int, ...]]
+
+def _positional(implementation: type, names: Tuple[str, ...]) -> bool:
+    if not names:
+        return True
+    # The signature of the class itself accounts for metaclass __call__,
+    # __new__ and __init__, and already drops self/cls.
+    try:
+        parameters = list(inspect.signature(implementation).parameters.values())
+    except (TypeError, ValueError):
+        return False
+    if len(parameters) < len(names):
+        return False
+    for parameter, name in zip(parameters, names):
+        if parameter.name != name or parameter.kind not in (
+            inspect.Parameter.POSITIONAL_ONLY,
+            inspect.Parameter.POSITIONAL_OR_KEYWORD
+        ):
+            return False
+    return True
+
+def _run_plan(slots: Tuple[Any, ...], steps: Tuple[_Step, ...], root: int) -> Any:
+    # Steps are in post-order, so every dependency slot is filled before
+    # the step that consumes it runs.
+    results = list(slots)
+    for slot, implementation, names, dependencies in steps:
+        if names is None:
+            results[slot] = implementation(*map(results.__getitem__, dependencies))
+        else:
+            results[slot] = implementation(
+                **dict(zip(names, map(results.__getitem__, dependencies)))
+            )
+    return results[root]
+
 class Injector(object):
+    __slots__ = (
+        "interfaces",
+        "_by_type",
+        "services",
+        "_argspec_cache",
+        "_factory",
+        "__weakref__",
+    )
+
     def __init__(self) -> None:
         self.interfaces = {} # type: Dict[str, type]
-        self.scoped_services = [] # type: List[Tuple[type, type]]
-        self.singleton_services = [] # type: List[Tuple[type, Any]]
+        self._by_type = set() # type: Set[type]
+        self.services = {} # type: Dict[type, Tuple[bool, Any]]
+        self._argspec_cache = {} # type: Dict[type, Tuple[Tuple[Tuple[str, Any], ...], bool]]
+        self._factory = {} # type: Dict[type, Callable[[], Any]]
     
     def implementation(self, interface: type) -> Any:
-        for k, tv in self.scoped_services:
-            if k == interface:
-                return tv
-        for k, av in self.singleton_services:
-            if k == interface:
-                return av
-        raise UnimplementedError(interface.__name__)
+        entry = self.services.get(interface)
+        if entry is None:
+            raise UnimplementedError(interface.__name__)
+        return entry[1]
     
     def interface(self, interface_id: Any) -> type:
-        if not isinstance(interface_id, (str, type,)):
+        # Exact type checks are plain pointer compares; isinstance() is
+        # only needed for metaclasses and str subclasses.
+        t = type(interface_id)
+        if t is str:
+            name = interface_id
+        elif t is type or isinstance(interface_id, type):
+            if interface_id in self._by_type:
+                return interface_id
+            name = interface_id.__name__
+        elif isinstance(interface_id, str):
+            name = interface_id
+        else:
             raise TypeError("The interfaceid must be a str or type")
-        if isinstance(interface_id, type):
-            interface_id = interface_id.__name__
-        if interface_id in self.interfaces:
-            return self.interfaces[interface_id]
-        raise UnimplementedError(interface_id)
+        implemented = self.interfaces.get(name)
+        if implemented is None:
+            raise UnimplementedError(name)
+        return implemented
+
+    def _parameters(self, fn: Any) -> Tuple[Tuple[str, Any], ...]:
+        # get_type_hints() on a class returns the class body
+        # annotations, not those of its constructor.
+        target = fn.__init__ if isinstance(fn, type) else fn # type: ignore
+        if inspect.isfunction(target) or inspect.ismethod(target):
+            try:
+                annotations = get_type_hints(target)
+            except (NameError, TypeError):
+                # Forward references that cannot be evaluated in the module
+                # of fn are left as strings and looked up by name instead.
+                annotations = target.__annotations__
+        else:
+            # Partials, callable instances and builtins are not handled
+            # by get_type_hints(), but their signature still is.
+            annotations = inspect.getfullargspec(target).annotations
+        return tuple(
+            (parametername, parametertype,)
+            for parametername, parametertype in annotations.items()
+            if parametername != "return"
+        )
+
+    def _constructor(
+        self,
+        implementation: type
+    ) -> Tuple[Tuple[Tuple[str, Any], ...], bool]:
+        # Only constructors of registered implementations are cached, so
+        # the cache is bounded by the registrations.
+        constructor = self._argspec_cache.get(implementation)
+        if constructor is None:
+            parameters = self._parameters(implementation.__init__) # type: ignore
+            names = tuple(parametername for parametername, _ in parameters)
+            constructor = (parameters, _positional(implementation, names),)
+            self._argspec_cache[implementation] = constructor
+        return constructor
 
     def _register_interface(self, interface: type) -> None:
-        if interface.__name__ in self.interfaces:
-            raise ImplementedError(interface.__name__)
-        self.interfaces[interface.__name__] = interface
+        name = interface.__name__
+        if name in self.interfaces:
+            raise ImplementedError(name)
+        self.interfaces[name] = interface
+        self._by_type.add(interface)
     
     def register_scoped(self, interface: type, implementation: type) -> None:
-        if not issubclass(implementation, interface):
+        if not isinstance(implementation, type):
+            raise TypeError("The implementation must be a type")
+        # Checking the MRO directly is cheaper than issubclass() for the
+        # common case; issubclass() still covers ABC virtual subclasses.
+        if (interface not in implementation.__mro__ and
+                not issubclass(implementation, interface)):
             raise ImplementationInterfaceMismatchError(
                 implementation.__name__,
                 interface.__name__
             )
+        self._constructor(implementation)
         self._register_interface(interface)
-        self.scoped_services.append((interface, implementation,))
+        self.services[interface] = (True, implementation,)
 
     def register_singleton(self, interface: type, singleton: Any) -> None:
         if not isinstance(singleton, interface):
@@ -115,35 +232,80 @@ class Injector(object):
                 interface.__name__
             )
         self._register_interface(interface)
-        self.singleton_services.append((interface, singleton,))
+        self.services[interface] = (False, singleton,)
+        self._factory[interface] = partial(_identity, singleton)
 
-    def resolve(self, interface: type, stack: Optional[List[type]]=None) -> Any:
-        implementation = self.implementation(interface)
-        if not isinstance(implementation, type):
-            return implementation
-        if stack is not None and interface in stack:
-            raise CyclicDependencyError(
-                interface.__name__,
-                [x.__name__ for x in stack]
-            )
-        fullargspec = inspect.getfullargspec(implementation.__init__) # type: ignore
-        kwargs = {} # type: Dict[str, Any]
-        for parametername, parametertype in fullargspec.annotations.items():
-            if parametername == "return":
-                continue
-            kwargs[parametername] = self.resolve(
+    def _emit(
+        self,
+        interface: type,
+        stack: Dict[type, None],
+        slots: List[Any],
+        steps: List[_Step]
+    ) -> int:
+        entry = self.services.get(interface)
+        if entry is None:
+            raise UnimplementedError(interface.__name__)
+        scoped, implementation = entry
+        if not scoped:
+            slots.append(implementation)
+            return len(slots) - 1
+        if interface in stack:
+            raise CyclicDependencyError(interface, tuple(stack))
+        substack = {**stack, interface: None}
+        parameters, positional = self._constructor(implementation)
+        dependencies = tuple(
+            self._emit(
                 self.interface(parametertype),
-                stack + [interface] if stack is not None else [interface]
+                substack,
+                slots,
+                steps
             )
-        return implementation(**kwargs)
+            for _, parametertype in parameters
+        )
+        slots.append(None)
+        steps.append((
+            len(slots) - 1,
+            implementation,
+            None if positional else tuple(parametername for parametername, _ in parameters),
+            dependencies,
+        ))
+        return len(slots) - 1
+
+    def _plan(
+        self,
+        interface: type,
+        stack: Dict[type, None]
+    ) -> Tuple[Tuple[Any, ...], Tuple[_Step, ...], int]:
+        slots = [] # type: List[Any]
+        steps = [] # type: List[_Step]
+        root = self._emit(interface, stack, slots, steps)
+        return tuple(slots), tuple(steps), root
+
+    def _compile(self, interface: type) -> Callable[[], Any]:
+        factory = self._factory.get(interface)
+        if factory is None:
+            factory = partial(_run_plan, *self._plan(interface, {}))
+            self._factory[interface] = factory
+        return factory
+
+    def validate(self) -> None:
+        for interface in self.services:
+            self._compile(interface)
+
+    def resolve(self, interface: type, stack: Optional[List[type]]=None) -> Any:
+        if stack:
+            # Cached factories were only checked for cycles against an
+            # empty stack, so a seeded stack needs a fresh plan.
+            return _run_plan(*self._plan(interface, dict.fromkeys(stack)))
+        factory = self._factory.get(interface)
+        if factory is None:
+            factory = self._compile(interface)
+        return factory()
 
     def resolve_callable(self, fn: Any) -> Callable[[], Any]:
         if not callable(fn):
             raise ValueError("The argument must be callable")
-        fullargspec = inspect.getfullargspec(fn)
         kwargs = {} # type: Dict[str, Any]
-        for parametername, parametertype in fullargspec.annotations.items():
-            if parametername == "return":
-                continue
+        for parametername, parametertype in self._parameters(fn):
             kwargs[parametername] = self.resolve(self.interface(parametertype))
-        return lambda: fn(**kwargs)
+        return partial(fn, **kwargs)
@@ -26,7 +26,9 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import functools
 import unittest
+import weakref
 
 from taddi import (
     CyclicDependencyError,
@@ -35,7 +37,7 @@ from taddi import (
     UnimplementedError,
     Injector
 )
-from typing import cast
+from typing import Any, cast
 
 class ComplexService(object):
     pass
@@ -122,6 +124,47 @@ class InjectorTestCase(unittest.TestCase):
         self.assertIsInstance(supercomplex_service.simpleone_service, SimpleOneServiceImpl)
         self.assertIsInstance(supercomplex_service.simpletwo_service, SimpleTwoServiceImpl)
     
+    def testResolveKeywordOnlyDependency(self) -> None:
+        class KeywordService(object):
+            def __init__(self, *, simpleone_service: SimpleOneService) -> None:
+                self.simpleone_service = simpleone_service
+        injector = Injector()
+        injector.register_scoped(KeywordService, KeywordService)
+        injector.register_scoped(SimpleOneService, SimpleOneServiceImpl)
+        keyword_service = injector.resolve(KeywordService)
+        self.assertIsInstance(keyword_service.simpleone_service, SimpleOneServiceImpl)
+    
+    def testResolvePositionalOnlyDependency(self) -> None:
+        class PositionalService(object):
+            def __init__(self, simpleone_service: SimpleOneService, /) -> None:
+                self.simpleone_service = simpleone_service
+        injector = Injector()
+        injector.register_scoped(PositionalService, PositionalService)
+        injector.register_scoped(SimpleOneService, SimpleOneServiceImpl)
+        positional_service = injector.resolve(PositionalService)
+        self.assertIsInstance(positional_service.simpleone_service, SimpleOneServiceImpl)
+    
+    def testResolveCustomConstruction(self) -> None:
+        class NewService(object):
+            def __new__(cls, **kwargs: Any) -> "NewService":
+                return super(NewService, cls).__new__(cls)
+            def __init__(self, simpleone_service: SimpleOneService) -> None:
+                self.simpleone_service = simpleone_service
+        class KeywordMeta(type):
+            def __call__(cls, **kwargs: Any) -> Any:
+                return super(KeywordMeta, cls).__call__(**kwargs)
+        class MetaService(object, metaclass=KeywordMeta):
+            def __init__(self, simpleone_service: SimpleOneService) -> None:
+                self.simpleone_service = simpleone_service
+        injector = Injector()
+        injector.register_scoped(NewService, NewService)
+        injector.register_scoped(MetaService, MetaService)
+        injector.register_scoped(SimpleOneService, SimpleOneServiceImpl)
+        new_service = injector.resolve(NewService)
+        self.assertIsInstance(new_service.simpleone_service, SimpleOneServiceImpl)
+        meta_service = injector.resolve(MetaService)
+        self.assertIsInstance(meta_service.simpleone_service, SimpleOneServiceImpl)
+    
     def testResolveCallable(self) -> None:
         def inner(supercomplex_service: SuperComplexService) -> int:
             self.assertIsInstance(supercomplex_service, SuperComplexServiceImpl)
@@ -140,6 +183,63 @@ class InjectorTestCase(unittest.TestCase):
         self.assertTrue(callable(inner_wrap))
         self.assertEqual(inner_wrap(), 1)
     
+    def testResolveCallableClass(self) -> None:
+        class Consumer(object):
+            label: str = "consumer"
+            def __init__(self, simpleone_service: SimpleOneService) -> None:
+                self.simpleone_service = simpleone_service
+        injector = Injector()
+        injector.register_scoped(SimpleOneService, SimpleOneServiceImpl)
+        consumer = injector.resolve_callable(Consumer)()
+        self.assertIsInstance(consumer, Consumer)
+        self.assertIsInstance(consumer.simpleone_service, SimpleOneServiceImpl)
+    
+    def testResolveCallablePartial(self) -> None:
+        def inner(x: int, simpleone_service: SimpleOneService) -> int:
+            return simpleone_service.transmogrify(x, 1)
+        injector = Injector()
+        injector.register_scoped(SimpleOneService, SimpleOneServiceImpl)
+        inner_wrap = injector.resolve_callable(functools.partial(inner, 2))
+        self.assertEqual(inner_wrap(), 3)
+    
+    def testResolveCallableInstance(self) -> None:
+        class Inner(object):
+            def __call__(self, simpletwo_service: SimpleTwoService) -> int:
+                return simpletwo_service.fiddle(1)
+        injector = Injector()
+        injector.register_scoped(SimpleTwoService, SimpleTwoServiceImpl)
+        inner_wrap = injector.resolve_callable(Inner())
+        self.assertEqual(inner_wrap(), 4)
+    
+    def testResolveCallableUnhashable(self) -> None:
+        class Inner(object):
+            def __eq__(self, other: object) -> bool:
+                return self is other
+            def __call__(self, simpletwo_service: SimpleTwoService) -> int:
+                return simpletwo_service.fiddle(2)
+        injector = Injector()
+        injector.register_scoped(SimpleTwoService, SimpleTwoServiceImpl)
+        self.assertEqual(injector.resolve_callable(Inner())(), 9)
+    
+    def testWeakReference(self) -> None:
+        injector = Injector()
+        self.assertIs(weakref.ref(injector)(), injector)
+    
+    def testResolveLocalForwardReference(self) -> None:
+        class LocalService(object):
+            pass
+        class LocalServiceImpl(LocalService):
+            def __init__(self, local_dependency: "LocalDependency") -> None:
+                self.local_dependency = local_dependency
+        class LocalDependency(object):
+            pass
+        injector = Injector()
+        injector.register_scoped(LocalService, LocalServiceImpl)
+        injector.register_scoped(LocalDependency, LocalDependency)
+        local_service = injector.resolve(LocalService)
+        self.assertIsInstance(local_service, LocalServiceImpl)
+        self.assertIsInstance(local_service.local_dependency, LocalDependency)
+    
     def testImplementedError(self) -> None:
         with self.assertRaises(ImplementedError) as context:
             injector = Injector()
@@ -173,6 +273,17 @@ class InjectorTestCase(unittest.TestCase):
             injector.resolve(ComplexService)
         self.assertEqual(str(context.exception), "Interface SimpleTwoService is not implemented")
     
+    def testValidate(self) -> None:
+        injector = Injector()
+        injector.register_scoped(ComplexService, ComplexServiceImpl)
+        injector.register_scoped(SimpleOneService, SimpleOneServiceImpl)
+        with self.assertRaises(UnimplementedError) as context:
+            injector.validate()
+        self.assertEqual(str(context.exception), "Interface SimpleTwoService is not implemented")
+        injector.register_scoped(SimpleTwoService, SimpleTwoServiceImpl)
+        injector.validate()
+        self.assertIsInstance(injector.resolve(ComplexService), ComplexServiceImpl)
+    
     def testCyclicDependencyError(self) -> None:
         with self.assertRaises(CyclicDependencyError) as context:
             injector = Injector()
@@ -183,6 +294,23 @@ class InjectorTestCase(unittest.TestCase):
             "Cyclic dependency detected while resolving CyclicService"
             " (resolved: ['CyclicService'])"
         )
+        self.assertIs(context.exception.interface, CyclicService)
+        self.assertEqual(context.exception.stack, (CyclicService,))
+        with self.assertRaises(CyclicDependencyError) as context:
+            injector = Injector()
+            injector.register_scoped(SimpleOneService, SimpleOneServiceImpl)
+            injector.resolve(SimpleOneService)
+            injector.resolve(SimpleOneService, [SimpleOneService])
+        self.assertEqual(
+            str(context.exception),
+            "Cyclic dependency detected while resolving SimpleOneService"
+            " (resolved: ['SimpleOneService'])"
+        )
+        self.assertEqual(
+            str(CyclicDependencyError("CyclicService", ["CyclicService"])),
+            "Cyclic dependency detected while resolving CyclicService"
+            " (resolved: ['CyclicService'])"
+        )
 
 if __name__ == "__main__":
     unittest.main()